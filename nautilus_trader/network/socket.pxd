@@ -26,6 +26,7 @@ cdef class SocketClient:
     cdef str _encoding
     cdef bint _running
     cdef bint _stopped
+    cdef int _busy_poll_us
 
     cdef readonly object host  # TODO(cs): Temporary
     """The host for the socket client.\n\n:returns: `str`"""
@@ -35,3 +36,5 @@ cdef class SocketClient:
     """If the socket client is using SSL.\n\n:returns: `bool`"""
     cdef readonly bint is_connected
     """If the socket is connected.\n\n:returns: `bool`"""
+
+    cdef void _set_busy_poll(self) except *
@@ -14,6 +14,9 @@
 # -------------------------------------------------------------------------------------------------
 
 import asyncio
+import os
+import socket
+import sys
 import types
 from typing import Callable, Optional
 
@@ -23,6 +26,7 @@ from nautilus_trader.core.correctness cimport Condition
 
 
 cdef bytes DEFAULT_CRLF = b"\r\n"
+cdef int SO_BUSY_POLL = 46  # Linux only, not exposed by the `socket` module
 
 
 cdef class SocketClient:
@@ -40,6 +44,7 @@ cdef class SocketClient:
         bint ssl=True,
         str encoding="utf-8",
         bytes crlf=None,
+        busy_poll_us=None,
     ):
         """
         Initialize a new instance of the ``WebSocketClient`` class.
@@ -62,6 +67,10 @@ cdef class SocketClient:
             The encoding to use when sending messages.
         crlf : bytes, optional
             The carriage return, line feed delimiter on which to split messages.
+        busy_poll_us : int, optional
+            The microseconds to busy poll the socket for on reads (Linux only), which
+            trades CPU for receive latency. If None then the `NAUTILUS_BUSY_POLL_US`
+            environment variable is used (default off).
 
         Raises
         ------
@@ -90,6 +99,9 @@ cdef class SocketClient:
         self._encoding = encoding
         self._running = False
         self._stopped = False
+        self._busy_poll_us = int(
+            busy_poll_us if busy_poll_us is not None else os.environ.get("NAUTILUS_BUSY_POLL_US", 0)
+        )
         self.is_connected = False
 
     async def connect(self):
@@ -100,6 +112,7 @@ cdef class SocketClient:
                 loop=self._loop,
                 ssl=self.ssl,
             )
+            self._set_busy_poll()
             await self.post_connection()
             self._loop.create_task(self.start())
             self._running = True
@@ -118,6 +131,18 @@ cdef class SocketClient:
     def stop(self):
         self._running = False
 
+    cdef void _set_busy_poll(self) except *:
+        if self._busy_poll_us <= 0 or not sys.platform.startswith("linux"):
+            return
+        sock = self._writer.get_extra_info("socket")
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, SO_BUSY_POLL, self._busy_poll_us)
+        except OSError as ex:
+            # Values above `net.core.busy_read` require CAP_NET_ADMIN
+            self._log.warning(f"Cannot set SO_BUSY_POLL: {ex}")
+
     async def reconnect(self):
         await self.disconnect()
         await self.connect()
@@ -15,7 +15,8 @@
 
 import os
 import pathlib
-from typing import Dict, List, Optional
+import threading
+from typing import Dict, List, Optional, Tuple
 
 import fsspec
 import pandas as pd
@@ -41,6 +42,13 @@ from nautilus_trader.serialization.arrow.util import clean_key
 from nautilus_trader.serialization.arrow.util import is_nautilus_class
 
 
+# Pre-buffering coalesces the column chunk reads of each row group into fewer,
+# larger (concurrent) range requests instead of one request per column chunk
+PARQUET_FORMAT = ds.ParquetFileFormat(
+    default_fragment_scan_options=ds.ParquetFragmentScanOptions(pre_buffer=True),
+)
+
+
 class DataCatalog(metaclass=Singleton):
     PROCESSED_FILES_FN = ".processed_raw_files.json"
     PARTITION_MAPPINGS_FN = "_partition_mappings.json"
@@ -58,6 +66,9 @@ class DataCatalog(metaclass=Singleton):
         """
         self.fs = fsspec.filesystem(fs_protocol)
         self.path = pathlib.Path(path)
+        self._dataset_cache: Dict[Tuple[str, Optional[str]], Tuple[str, ds.Dataset]] = {}
+        self._dataset_cache_lock = threading.Lock()
+        self._dataset_cache_generation = 0
 
     @classmethod
     def from_env(cls):
@@ -70,8 +81,84 @@ class DataCatalog(metaclass=Singleton):
         protocol, path = uri.split("://")
         return cls(path=path, fs_protocol=protocol)
 
+    # ---- DATASETS --------------------------------------------------------------------------------------- #
+
+    def dataset(self, path: str, partitioning: Optional[str] = "hive") -> ds.Dataset:
+        """
+        Return the dataset at `path`, cached while its `_metadata` file is unchanged.
+
+        Every `write_parquet` rewrites `{path}/_metadata`, so a cached dataset is reused
+        (skipping the directory walk and partition discovery) only while that file's
+        checksum matches the one taken when the dataset was loaded. Datasets without a
+        `_metadata` file are never cached.
+
+        Parameters
+        ----------
+        path : str
+            The full path of the dataset.
+        partitioning : str, optional
+            The partitioning flavor of the dataset.
+
+        Returns
+        -------
+        ds.Dataset
+
+        """
+        key = (str(path).rstrip("/"), partitioning)
+        # Taken before listing; a write racing the load leaves a token that won't match
+        token = self._dataset_token(key[0])
+        with self._dataset_cache_lock:
+            cached = self._dataset_cache.get(key)
+            generation = self._dataset_cache_generation
+        if cached is not None and token is not None and cached[0] == token:
+            return cached[1]
+
+        dataset = self._load_dataset(path=key[0], partitioning=partitioning)
+        with self._dataset_cache_lock:
+            # Don't cache a listing that an `invalidate` during the load may have outdated
+            if token is not None and generation == self._dataset_cache_generation:
+                self._dataset_cache[key] = (token, dataset)
+        return dataset
+
+    def _dataset_token(self, path: str) -> Optional[str]:
+        try:
+            return str(self.fs.checksum(f"{path}/_metadata"))
+        except FileNotFoundError:
+            return None
+
+    def _load_dataset(self, path: str, partitioning: Optional[str] = "hive") -> ds.Dataset:
+        return ds.dataset(
+            path,
+            format=PARQUET_FORMAT,
+            partitioning=partitioning,
+            filesystem=self.fs,
+        )
+
+    def invalidate(self, path: Optional[str] = None):
+        """
+        Drop the cached datasets for `path` (or all cached datasets if None).
+        """
+        with self._dataset_cache_lock:
+            self._dataset_cache_generation += 1
+            if path is None:
+                self._dataset_cache.clear()
+                return
+            path = str(path).rstrip("/")
+            for key in [key for key in self._dataset_cache if key[0] == path]:
+                del self._dataset_cache[key]
+
     # ---- QUERIES ---------------------------------------------------------------------------------------- #
 
+    def _read_table(self, full_path: str, filter_expr=None, use_cache=True):
+        if not use_cache:
+            return self._load_dataset(full_path).to_table(filter=filter_expr, use_threads=True)
+        try:
+            return self.dataset(full_path).to_table(filter=filter_expr, use_threads=True)
+        except FileNotFoundError:
+            # Files were rewritten (i.e. by another process) since the dataset was cached
+            self.invalidate(full_path)
+            return self.dataset(full_path).to_table(filter=filter_expr, use_threads=True)
+
     def _query(
         self,
         path,
@@ -81,6 +168,7 @@ class DataCatalog(metaclass=Singleton):
         end=None,
         ts_column="ts_event",
         raise_on_empty=True,
+        use_cache=True,
     ):
         filters = [filter_expr] if filter_expr is not None else []
         if instrument_ids is not None:
@@ -101,8 +189,9 @@ class DataCatalog(metaclass=Singleton):
             else:
                 return pd.DataFrame()
 
-        dataset = ds.dataset(full_path, partitioning="hive", filesystem=self.fs)
-        table = dataset.to_table(filter=combine_filters(*filters))
+        table = self._read_table(
+            full_path, filter_expr=combine_filters(*filters), use_cache=use_cache
+        )
         df = table.to_pandas().drop_duplicates()
         mappings = load_mappings(fs=self.fs, path=full_path)
         for col in mappings:
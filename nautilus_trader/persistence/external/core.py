@@ -1,3 +1,10 @@
+import contextlib
+import copy
+import io
+import itertools
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Dict, List, Optional, Union
 
 import dask
@@ -9,11 +16,16 @@ from dask import compute
 from dask import delayed
 from dask.diagnostics import ProgressBar
 from dask.utils import parse_bytes
+from fsspec.compression import compr
 from fsspec.core import OpenFile
+from fsspec.core import url_to_fs
+from fsspec.implementations.local import LocalFileSystem
+from fsspec.utils import infer_compression
 from tqdm import tqdm
 
 from nautilus_trader.model.data.base import GenericData
 from nautilus_trader.model.instruments.base import Instrument
+from nautilus_trader.model.orderbook.data import OrderBookData
 from nautilus_trader.persistence.catalog import DataCatalog
 from nautilus_trader.persistence.external.metadata import _glob_path_to_fs
 from nautilus_trader.persistence.external.metadata import load_processed_raw_files
@@ -37,6 +49,14 @@ except ImportError:
     distributed = None
 
 
+COALESCE_MAX_BYTES = parse_bytes("256mb")
+DEFAULT_IO_BUFFER_SIZE = parse_bytes("1mb")
+PIPELINE_DEPTH = 2
+PROGRESS_FLUSH_BYTES = parse_bytes("1mb")
+DEFAULT_ROW_GROUP_SIZE = 64_000
+ROW_GROUP_SIZES: Dict[type, int] = {OrderBookData: 8_000}
+
+
 class RawFile:
     def __init__(
         self,
@@ -44,6 +64,8 @@ class RawFile:
         block_size: Optional[int] = None,
         partition_name_callable: Optional[Callable] = None,
         progress=False,
+        io_buffer_size: int = DEFAULT_IO_BUFFER_SIZE,
+        progress_flush_bytes: Optional[int] = None,
     ):
         """
         A wrapper of fsspec.OpenFile that processes a raw file and writes to parquet.
@@ -61,44 +83,200 @@ class RawFile:
             parquet partition filename. Can be used to partition data in a more intelligent way (for example by date)
         progress: bool
             Show a progress bar while processing this individual file
+        io_buffer_size: int
+            The buffer size for reads of the compressed stream underneath a decompressor
+        progress_flush_bytes: int, optional
+            The minimum bytes read between progress bar updates (default max(`block_size`, 1mb))
         """
         self.open_file = open_file
         self.block_size = block_size
+        self.io_buffer_size = io_buffer_size
         self.partition_name_callable = partition_name_callable
-        if progress:
-            self.iter = read_progress(  # type: ignore
-                self.iter, total=self.open_file.fs.stat(self.open_file.path)["size"]
-            )
+        self.progress = progress
+        self.progress_flush_bytes = progress_flush_bytes
+
+    def __reduce__(self):
+        # Pickle plain values only: the filesystem pickles as its constructor arguments
+        # (restored from fsspec's instance cache) and any open file handles are dropped
+        open_file = OpenFile(
+            fs=self.open_file.fs,
+            path=self.open_file.path,
+            mode="rb",
+            compression=self.open_file.compression,
+        )
+        return (
+            self.__class__,
+            (
+                open_file,
+                self.block_size,
+                self.partition_name_callable,
+                self.progress,
+                self.io_buffer_size,
+                self.progress_flush_bytes,
+            ),
+        )
 
     def iter(self):
-        with self.open_file as f:
+        if not self.progress:
+            yield from self._iter()
+            return
+        # The progress bar (and the size lookup) is only created once reading starts
+        flush_bytes = self.progress_flush_bytes or max(self.block_size or 0, PROGRESS_FLUSH_BYTES)
+        yield from read_progress(
+            self._iter,
+            total=self.open_file.fs.stat(self.open_file.path)["size"],
+            flush_bytes=flush_bytes,
+        )()
+
+    def _iter(self):
+        if self._can_coalesce():
+            yield from self._coalesced_iter()
+            return
+        with self._open() as f:
             while True:
                 raw = f.read(self.block_size)
                 if not raw:
                     return
                 yield raw
 
+    @contextlib.contextmanager
+    def _open(self):
+        compression = self.open_file.compression
+        if compression is None:
+            with self.open_file as f:
+                yield f
+            return
+        # Decompressors read their source in small (8kb) pieces; buffer those reads
+        with self.open_file.fs.open(self.open_file.path, mode="rb") as source:
+            buffered = io.BufferedReader(source, buffer_size=self.io_buffer_size)
+            with compr[compression](buffered, mode="rb") as f:
+                yield f
+
+    def _can_coalesce(self) -> bool:
+        # Range requests only pay off for (uncompressed) remote files.
+        # NOTE: `cat_ranges` only exists in fsspec releases newer than the 2021.07.0
+        # in the lock file (`^2021.7.0` allows them), so under the lock file this path
+        # is inert and `iter` uses the streaming read loop.
+        fs = self.open_file.fs
+        return (
+            bool(self.block_size)
+            and self.open_file.compression is None
+            and hasattr(fs, "cat_ranges")
+            and not isinstance(fs, LocalFileSystem)
+        )
+
+    def _coalesced_iter(self):
+        """
+        Read blocks with one `cat_ranges` request per batch of blocks (bounded by
+        `COALESCE_MAX_BYTES`) rather than one request per block.
+        """
+        fs = self.open_file.fs
+        path = self.open_file.path
+        size = fs.size(path)
+        starts = list(range(0, size, self.block_size))
+        per_request = max(1, COALESCE_MAX_BYTES // self.block_size)
+        for i in range(0, len(starts), per_request):
+            batch = starts[i : i + per_request]
+            ends = [min(start + self.block_size, size) for start in batch]
+            for block in fs.cat_ranges([path] * len(batch), batch, ends):
+                # Newer fsspec returns (rather than raises) per-range errors by default
+                if isinstance(block, Exception):
+                    raise block
+                yield block
+
 
 def process_raw_file(catalog: DataCatalog, raw_file: RawFile, reader: Reader):
+    """
+    Read, parse and write `raw_file` to `catalog`.
+
+    Reading (and decompressing), parsing and writing run as a pipeline on separate
+    threads, so the next block is being read and parsed while the last is written.
+    Writes (and their locks) stay on the calling thread.
+    """
+
+    def parse(blocks):
+        for block in blocks:
+            objs = [x for x in reader.parse(block) if x is not None]
+            dicts = split_and_serialize(objs)
+            yield dicts_to_dataframes(dicts)
+
     n_rows = 0
-    for block in raw_file.iter():
-        objs = [x for x in reader.parse(block) if x is not None]
-        dicts = split_and_serialize(objs)
-        dataframes = dicts_to_dataframes(dicts)
+    for dataframes in _threaded(parse(_threaded(raw_file.iter()))):
         n_rows += write_tables(catalog=catalog, tables=dataframes)
     return n_rows
 
 
+_PIPELINE_DONE = object()
+
+
+def _threaded(iterable, maxsize: int = PIPELINE_DEPTH):
+    """
+    Iterate `iterable` on a background thread, running at most `maxsize` items ahead.
+    """
+    items: queue.Queue = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+    thread = threading.Thread(target=_produce, args=(iterable, items, stop), daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, error = items.get()
+            if error is not None:
+                raise error
+            if item is _PIPELINE_DONE:
+                return
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+def _produce(iterable, items: queue.Queue, stop: threading.Event):
+    try:
+        for item in iterable:
+            if not _put(items, (item, None), stop):
+                return
+        _put(items, (_PIPELINE_DONE, None), stop)
+    except BaseException as e:
+        _put(items, (_PIPELINE_DONE, e), stop)
+    finally:
+        if hasattr(iterable, "close"):
+            iterable.close()
+
+
+def _put(items: queue.Queue, item, stop: threading.Event) -> bool:
+    # Put `item`, giving up (returning False) once the consumer has stopped
+    while not stop.is_set():
+        try:
+            items.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
 def process_files(
     glob_path,
-    reader: Reader,
+    reader: Optional[Reader],
     catalog: DataCatalog,
     block_size="128mb",
     compression="infer",
     scheduler: Union[str, "distributed.Client"] = "sync",
+    max_workers: Optional[int] = None,
+    reader_factory: Optional[Callable[[], Reader]] = None,
     **kw,
 ):
-    assert scheduler == "sync" or str(scheduler.__module__) == "distributed.client"
+    """
+    Process all files matching `glob_path` with `reader` and write them to `catalog`.
+
+    `scheduler` may be "sync", "threads" (a local thread pool of `max_workers`,
+    skipping the dask task graph entirely) or a `distributed.Client`.
+
+    Instead of a `reader`, a `reader_factory` may be passed; a fresh reader is then
+    created for each file where (and when) it is processed, so only the factory is
+    shipped to dask workers.
+    """
+    assert scheduler in ("sync", "threads") or str(scheduler.__module__) == "distributed.client"
+    assert (reader is None) != (reader_factory is None), "Pass one of `reader` or `reader_factory`"
     raw_files = make_raw_files(
         glob_path=glob_path,
         reader=reader,
@@ -106,13 +284,46 @@ def process_files(
         compression=compression,
         **kw,
     )
-    tasks = [
-        delayed(process_raw_file)(catalog=catalog, reader=reader, raw_file=rf) for rf in raw_files
-    ]
-    with ProgressBar():
-        with dask.config.set(scheduler=scheduler):
-            results = compute(tasks)
-    return dict((rf.open_file.path, value) for rf, value in zip(raw_files, results[0]))
+    if reader_factory is None:
+        # Readers buffer partial lines between blocks, so threads each need their own copy
+        def reader_factory():
+            return copy.copy(reader)
+
+    if scheduler == "threads":
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(
+                executor.map(
+                    lambda rf: process_raw_file(
+                        catalog=catalog, reader=reader_factory(), raw_file=rf
+                    ),
+                    raw_files,
+                )
+            )
+    else:
+        if reader is not None:
+            tasks = [
+                delayed(process_raw_file)(catalog=catalog, reader=reader, raw_file=rf)
+                for rf in raw_files
+            ]
+        else:
+            tasks = [
+                delayed(_process_raw_file_with_factory)(
+                    catalog=catalog, reader_factory=reader_factory, raw_file=rf
+                )
+                for rf in raw_files
+            ]
+        with ProgressBar():
+            with dask.config.set(scheduler=scheduler):
+                results = compute(tasks)[0]
+    # Writes may have happened in other processes
+    catalog.invalidate()
+    return dict((rf.open_file.path, value) for rf, value in zip(raw_files, results))
+
+
+def _process_raw_file_with_factory(
+    catalog: DataCatalog, raw_file: RawFile, reader_factory: Callable[[], Reader]
+):
+    return process_raw_file(catalog=catalog, raw_file=raw_file, reader=reader_factory())
 
 
 def make_raw_files(glob_path, block_size="128mb", compression="infer", **kw) -> List[RawFile]:
@@ -120,11 +331,49 @@ def make_raw_files(glob_path, block_size="128mb", compression="infer", **kw) ->
     return [RawFile(open_file=f, block_size=parse_bytes(block_size)) for f in files]
 
 
-def scan_files(glob_path, compression="infer", **kw) -> List[OpenFile]:
-    fs = _glob_path_to_fs(glob_path)
+def scan_files(glob_path: Union[str, List[str]], compression="infer", **kw) -> List[OpenFile]:
+    """
+    Return an `OpenFile` for each (unprocessed) file matching `glob_path`, which may be a
+    list of globs; several globs are listed concurrently.
+    """
+    glob_paths = [glob_path] if isinstance(glob_path, str) else list(glob_path)
+    if not glob_paths:
+        return []
+    fs = _glob_path_to_fs(glob_paths[0])
     processed = load_processed_raw_files(fs=fs)
-    open_files = fsspec.open_files(glob_path, compression=compression, **kw)
-    return [of for of in open_files if of.path not in processed]
+    if len(glob_paths) == 1:
+        matches = [_expand_glob(glob_paths[0], compression=compression, **kw)]
+    else:
+        with ThreadPoolExecutor(max_workers=len(glob_paths)) as executor:
+            matches = list(
+                executor.map(lambda g: _expand_glob(g, compression=compression, **kw), glob_paths)
+            )
+    open_files: Dict[str, OpenFile] = {}
+    for of in itertools.chain.from_iterable(matches):
+        if of.path not in processed:
+            open_files.setdefault(of.path, of)
+    return list(open_files.values())
+
+
+def _expand_glob(glob_path: str, compression="infer", **kw) -> List[OpenFile]:
+    # One listing of `glob_path`, taking file types from it rather than making an
+    # `isdir` call per match like `fsspec.open_files` (a request each on remote filesystems)
+    fs, path = url_to_fs(glob_path, **kw)
+    if any(c in path for c in "*?["):
+        matches = fs.glob(path, detail=True)
+        paths = [p for p, info in sorted(matches.items()) if info["type"] != "directory"]
+    else:
+        # A literal path is returned as is (like `fsspec.open_files`), whether it exists or not
+        paths = [path]
+    return [
+        OpenFile(
+            fs=fs,
+            path=p,
+            mode="rb",
+            compression=infer_compression(p) if compression == "infer" else compression,
+        )
+        for p in paths
+    ]
 
 
 def split_and_serialize(objs: List) -> Dict[type, Dict[str, List]]:
@@ -133,17 +382,23 @@ def split_and_serialize(objs: List) -> Dict[type, Dict[str, List]]:
     """
     # Split objects into their respective tables
     values: Dict[type, Dict[str, List]] = {}
+    # Table and generic flag per concrete type, resolved once per chunk rather than per object
+    dispatch: Dict[type, tuple] = {}
+    serialize = ParquetSerializer.serialize
     for obj in objs:
-        cls = get_cls_table(type(obj))
-        if cls not in values:
-            values[cls] = {}
-        if isinstance(obj, GenericData):
-            cls = obj.data_type.type
-        for data in maybe_list(ParquetSerializer.serialize(obj)):
+        obj_type = type(obj)
+        if obj_type not in dispatch:
+            table = values.setdefault(get_cls_table(obj_type), {})
+            dispatch[obj_type] = (table, isinstance(obj, GenericData))
+        table, is_generic = dispatch[obj_type]
+        if is_generic:
+            table = values[obj.data_type.type]
+        for data in maybe_list(serialize(obj)):
             instrument_id = data.get("instrument_id", None)
-            if instrument_id not in values[cls]:
-                values[cls][instrument_id] = []
-            values[cls][instrument_id].append(data)
+            rows = table.get(instrument_id)
+            if rows is None:
+                rows = table[instrument_id] = []
+            rows.append(data)
     return values
 
 
@@ -159,8 +414,9 @@ def dicts_to_dataframes(dicts) -> Dict[type, Dict[str, pd.DataFrame]]:
             data = dicts[cls].pop(ins_id)
             if not data:
                 continue
-            df = pd.DataFrame(data)
-            df = df.sort_values("ts_init")
+            df = _dicts_to_frame(data)
+            if not df["ts_init"].is_monotonic_increasing:
+                df = df.sort_values("ts_init")
             if "instrument_id" in df.columns:
                 df = df.astype({"instrument_id": "category"})
             tables[cls][ins_id] = df
@@ -168,6 +424,15 @@ def dicts_to_dataframes(dicts) -> Dict[type, Dict[str, pd.DataFrame]]:
     return tables
 
 
+def _dicts_to_frame(data: List[Dict]) -> pd.DataFrame:
+    # Serialized dicts of a single type share their keys; building the frame from
+    # one list per column avoids pandas' intermediate 2D object array.
+    keys = data[0].keys()
+    if any(d.keys() != keys for d in data):
+        return pd.DataFrame(data)
+    return pd.DataFrame({key: [d[key] for d in data] for key in keys})
+
+
 def determine_partition_cols(cls: type, instrument_id: str = None):
     """
     Determine partition columns (if any) for this type `cls`
@@ -183,6 +448,16 @@ def determine_partition_cols(cls: type, instrument_id: str = None):
     return
 
 
+def determine_row_group_size(cls: type) -> int:
+    """
+    Determine the parquet row group size for this type `cls`
+    """
+    for base, size in ROW_GROUP_SIZES.items():
+        if issubclass(cls, base):
+            return size
+    return DEFAULT_ROW_GROUP_SIZE
+
+
 def read_and_clear_existing_data(
     catalog: DataCatalog,
     path: str,
@@ -199,6 +474,7 @@ def read_and_clear_existing_data(
             instrument_ids=instrument_id,
             ts_column="ts_init",
             raise_on_empty=False,
+            use_cache=False,  # About to be rewritten, and only one partition is needed
         )
         if not existing.empty:
             # Remove this file/partition, will be written again
@@ -273,7 +549,9 @@ def write_tables(catalog: DataCatalog, tables: Dict[type, Dict[str, pd.DataFrame
                 df=data,
                 partition_cols=partition_cols,
                 schema=schema,
+                row_group_size=determine_row_group_size(cls),
             )
+            catalog.invalidate(path)
         rows_written += len(df)
 
     return rows_written
@@ -286,10 +564,11 @@ def write_parquet(
     partition_cols: Optional[List[str]],
     schema: pa.Schema,
     partition_name_callable: Optional[Callable] = None,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
     **parquet_dataset_kwargs,
 ):
     """
-    Write a single dataframe to parquet.
+    Write a single dataframe to parquet, in row groups of at most `row_group_size` rows.
     """
     # Check partition values are valid before writing to parquet
     mappings = check_partition_columns(df=df, partition_columns=partition_cols)
@@ -311,6 +590,7 @@ def write_parquet(
         version="2.0",
         metadata_collector=metadata_collector,
         partition_filename_cb=partition_name_callable,
+        row_group_size=row_group_size,
         **parquet_dataset_kwargs,
     )
 
@@ -331,15 +611,21 @@ def write_chunk(catalog: DataCatalog, chunk: List):
     write_tables(catalog=catalog, tables=tables)
 
 
-def read_progress(func, total):
+def read_progress(func, total, flush_bytes: int = 1):
     """
-    Wrap a file handle and update progress bar as bytes are read
+    Wrap a file handle and update progress bar as bytes are read, at most once per `flush_bytes`
     """
     progress = tqdm(total=total)
 
     def inner(*args, **kwargs):
+        pending = 0
         for data in func(*args, **kwargs):
-            progress.update(n=len(data))
+            pending += len(data)
+            if pending >= flush_bytes:
+                progress.update(n=pending)
+                pending = 0
             yield data
+        if pending:
+            progress.update(n=pending)
 
     return inner
@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import copy
 import inspect
 import logging
 import sys
@@ -180,6 +181,13 @@ class TextReader(ByteReader):
         )
         self.line_preprocessor = line_preprocessor or LinePreprocessor()
 
+    def __copy__(self):
+        # The line preprocessor holds per-line state, so it can't be shared
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new.line_preprocessor = copy.copy(self.line_preprocessor)
+        return new
+
     def parse(self, block) -> Generator:  # noqa: C901
         self.buffer += block
         if b"\n" in block:
@@ -215,6 +223,7 @@ class CSVReader(Reader):
         instrument_provider_update=None,
         chunked=True,
         as_dataframe=True,
+        columns: Optional[List[str]] = None,
     ):
         """
         Initialize a new instance of the ``CSVReader`` class.
@@ -230,6 +239,9 @@ class CSVReader(Reader):
             passed will potentially contain many lines (a block).
         as_dataframe: bool, default=False
             If as_dataframe=True, the passes block will be parsed into a DataFrame before passing to `block_parser`
+        columns: List[str], optional
+            If as_dataframe=True, only parse these columns (the others are skipped by the CSV parser rather than
+            converted and dropped)
 
         """
         super().__init__(
@@ -240,6 +252,7 @@ class CSVReader(Reader):
         self.header: Optional[List[str]] = None
         self.chunked = chunked
         self.as_dataframe = as_dataframe
+        self.columns = columns
 
     def parse(self, block: bytes) -> Generator:
         if self.header is None:
@@ -251,7 +264,7 @@ class CSVReader(Reader):
 
         # Prepare - a little gross but allows a lot of flexibility
         if self.as_dataframe:
-            df = pd.read_csv(BytesIO(process), names=self.header)
+            df = pd.read_csv(BytesIO(process), names=self.header, usecols=self.columns)
             if self.chunked:
                 chunks = (df,)
             else:
@@ -1,4 +1,6 @@
 import contextlib
+import threading
+from typing import Dict
 
 
 try:
@@ -17,17 +19,42 @@ def running_on_dask() -> bool:
         return False
 
 
+def in_process_cluster() -> bool:
+    """
+    Whether the current dask scheduler and all of its workers live in this process
+    (i.e. a `Client(processes=False)`), so that threads are the only contenders.
+    """
+    from distributed import get_client
+
+    # The inproc transport can't cross process boundaries, so any worker connected to
+    # an `inproc://` scheduler is running in this process.
+    return get_client().scheduler.address.startswith("inproc://")
+
+
 @contextlib.contextmanager
 def distributed_lock(name):
     with distributed.Lock(name=name):
         yield
 
 
+_LOCKS: Dict[str, threading.Lock] = {}
+_LOCKS_LOCK = threading.Lock()
+
+
+@contextlib.contextmanager
+def local_lock(name):
+    with _LOCKS_LOCK:
+        lock = _LOCKS.setdefault(name, threading.Lock())
+    with lock:
+        yield
+
+
 @contextlib.contextmanager
 def named_lock(name):
-    if running_on_dask():
+    if running_on_dask() and not in_process_cluster():
         with distributed_lock(name=name):
             yield
     else:
-        # Nothing to do - sync program
-        yield
+        # Only threads of this process can contend; no need for a scheduler round trip
+        with local_lock(name=name):
+            yield
@@ -19,6 +19,11 @@ def tests(session: Session) -> None:
         session,
         "--ignore=tests/integration_tests/",
         "--ignore=tests/performance_tests/",
+        "-m",
+        "not slow",
+        # Acceptance test classes are independent backtests, `loadscope` keeps
+        # each class (and any class scoped engine fixture) on a single worker.
+        parallel=True,
     )
 
 
@@ -18,6 +18,7 @@ import bz2
 import contextlib
 import pathlib
 from asyncio import Future
+from functools import lru_cache
 from functools import partial
 from typing import Optional
 from unittest.mock import MagicMock
@@ -869,6 +870,7 @@ class BetfairDataProvider:
         )
 
     @staticmethod
+    @lru_cache(maxsize=8)
     def betfair_feed_parsed(market_id="1.166564490", folder="data"):
         instrument_provider = BetfairInstrumentProvider.from_instruments([])
         reader = BetfairTestStubs.betfair_reader(instrument_provider=instrument_provider)
@@ -879,7 +881,8 @@ class BetfairDataProvider:
             for block in rf.iter():
                 data.extend(reader.parse(block=block))
 
-        return data
+        # Cached and shared between callers, so return an immutable sequence
+        return tuple(data)
 
     @staticmethod
     def betfair_trade_ticks():
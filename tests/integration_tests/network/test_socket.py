@@ -14,6 +14,10 @@
 # -------------------------------------------------------------------------------------------------
 
 import asyncio
+import socket
+import sys
+from unittest.mock import Mock
+from unittest.mock import patch
 
 import pytest
 
@@ -44,3 +48,54 @@ async def test_socket_base(socket_server, event_loop):
     assert messages == [b"hello"] * 6
     await asyncio.sleep(1)
     client.stop()
+
+
+SO_BUSY_POLL = 46
+
+
+def _busy_poll_after_set(value: int) -> int:
+    # What a fresh socket reports after trying to set `value` (the system default if not permitted)
+    with socket.socket() as sock:
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, SO_BUSY_POLL, value)
+        except OSError:
+            pass
+        return sock.getsockopt(socket.SOL_SOCKET, SO_BUSY_POLL)
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="SO_BUSY_POLL is Linux only")
+async def test_socket_busy_poll(socket_server, event_loop):
+    socks = []
+    open_connection = asyncio.open_connection
+
+    async def capture_connection(*args, **kwargs):
+        reader, writer = await open_connection(*args, **kwargs)
+        # Spy on the transport socket (calls still reach the real socket)
+        sock = Mock(wraps=writer.get_extra_info("socket"))
+        get_extra_info = writer.get_extra_info
+        writer.get_extra_info = lambda name, default=None: (
+            sock if name == "socket" else get_extra_info(name, default)
+        )
+        socks.append(sock)
+        return reader, writer
+
+    host, port = socket_server
+    client = SocketClient(
+        host=host,
+        port=port,
+        loop=event_loop,
+        handler=lambda raw: None,
+        logger=TestStubs.logger(),
+        ssl=False,
+        busy_poll_us=50,
+    )
+    with patch("asyncio.open_connection", side_effect=capture_connection):
+        await client.connect()
+
+    # Without CAP_NET_ADMIN the option is left unset (a warning is logged) and connect still succeeds
+    sock = socks[0]
+    sock.setsockopt.assert_called_once_with(socket.SOL_SOCKET, SO_BUSY_POLL, 50)
+    assert sock.getsockopt(socket.SOL_SOCKET, SO_BUSY_POLL) == _busy_poll_after_set(50)
+    assert client.is_connected
+    client.stop()
@@ -14,12 +14,17 @@
 # -------------------------------------------------------------------------------------------------
 
 import datetime
+import hashlib
 import os
+import tempfile
 from decimal import Decimal
+from functools import lru_cache
 from typing import List
 
 import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from pandas import DataFrame
 
 from nautilus_trader.adapters.betfair.common import BETFAIR_VENUE
@@ -55,61 +60,104 @@ from nautilus_trader.model.orderbook.data import Order
 from tests.test_kit import PACKAGE_ROOT
 
 
+ARROW_CACHE_DIR = os.path.join(tempfile.gettempdir(), "nautilus_test_cache")
+ARROW_CACHE_VERSION = 1  # Bump when `CSVBarDataLoader` parsing changes
+
+
+# Parse each file once per process, callers should take a copy. Bounded so that only
+# the most recently used frames stay alive (trading some re-parsing for peak memory)
+@lru_cache(maxsize=8)
+def _load_cached(load, path: str) -> DataFrame:
+    return load(path)
+
+
+def _load_bars_arrow(path: str) -> DataFrame:
+    """
+    Load the bar CSV at `path`, parsing it once into an Arrow IPC file which is
+    then memory mapped by subsequent processes (stale if the CSV is newer).
+    """
+    # Keyed on the full path (not just the file name, which is shared across checkouts)
+    key = hashlib.sha256(f"{os.path.abspath(path)}:{ARROW_CACHE_VERSION}".encode()).hexdigest()
+    cache_path = os.path.join(ARROW_CACHE_DIR, f"{os.path.basename(path)}.{key[:16]}.arrow")
+    if not os.path.exists(cache_path) or os.path.getmtime(cache_path) < os.path.getmtime(path):
+        table = pa.Table.from_pandas(CSVBarDataLoader.load(path))
+        os.makedirs(ARROW_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}"
+        with pa.OSFile(tmp_path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, cache_path)  # Atomic, safe across concurrent workers
+
+    with pa.memory_map(cache_path) as source:
+        return pa.ipc.open_file(source).read_all().to_pandas()
+
+
+def _load_interest_rates(path: str) -> DataFrame:
+    # Multi-threaded Arrow CSV parser, `TIME` mixes annual/monthly/quarterly labels
+    convert_options = pacsv.ConvertOptions(column_types={"TIME": pa.string()})
+    return pacsv.read_csv(path, convert_options=convert_options).to_pandas()
+
+
 class TestDataProvider:
     @staticmethod
     def ethusdt_trades() -> DataFrame:
         path = os.path.join(PACKAGE_ROOT, "data", "binance-ethusdt-trades.csv")
-        return CSVTickDataLoader.load(path)
+        return _load_cached(CSVTickDataLoader.load, path).copy()
 
     @staticmethod
     def audusd_ticks() -> DataFrame:
         path = os.path.join(PACKAGE_ROOT, "data", "truefx-audusd-ticks.csv")
-        return CSVTickDataLoader.load(path)
+        return _load_cached(CSVTickDataLoader.load, path).copy()
 
     @staticmethod
     def usdjpy_ticks() -> DataFrame:
         path = os.path.join(PACKAGE_ROOT, "data", "truefx-usdjpy-ticks.csv")
-        return CSVTickDataLoader.load(path)
+        return _load_cached(CSVTickDataLoader.load, path).copy()
 
     @staticmethod
     def gbpusd_1min_bid() -> DataFrame:
         path = os.path.join(PACKAGE_ROOT, "data", "fxcm-gbpusd-m1-bid-2012.csv")
-        return CSVBarDataLoader.load(path)
+        return _load_cached(_load_bars_arrow, path).copy()
 
     @staticmethod
     def gbpusd_1min_ask() -> DataFrame:
         path = os.path.join(PACKAGE_ROOT, "data", "fxcm-gbpusd-m1-ask-2012.csv")
-        return CSVBarDataLoader.load(path)
+        return _load_cached(_load_bars_arrow, path).copy()
 
     @staticmethod
     def usdjpy_1min_bid() -> DataFrame:
         path = os.path.join(PACKAGE_ROOT, "data", "fxcm-usdjpy-m1-bid-2013.csv")
-        return CSVBarDataLoader.load(path)
+        return _load_cached(_load_bars_arrow, path).copy()
 
     @staticmethod
     def usdjpy_1min_ask() -> DataFrame:
         path = os.path.join(PACKAGE_ROOT, "data", "fxcm-usdjpy-m1-ask-2013.csv")
-        return CSVBarDataLoader.load(path)
+        return _load_cached(_load_bars_arrow, path).copy()
 
     @staticmethod
     def tardis_trades() -> DataFrame:
         path = os.path.join(PACKAGE_ROOT, "data", "tardis_trades.csv")
-        return TardisTradeDataLoader.load(path)
+        return _load_cached(TardisTradeDataLoader.load, path).copy()
 
     @staticmethod
     def tardis_quotes() -> DataFrame:
         path = os.path.join(PACKAGE_ROOT, "data", "tardis_quotes.csv")
-        return TardisQuoteDataLoader.load(path)
+        return _load_cached(TardisQuoteDataLoader.load, path).copy()
+
+    @staticmethod
+    def short_term_interest() -> DataFrame:
+        path = os.path.join(PACKAGE_ROOT, "data", "short-term-interest.csv")
+        return _load_cached(_load_interest_rates, path).copy()
 
     @staticmethod
     def parquet_btcusdt_trades() -> DataFrame:
         path = os.path.join(PACKAGE_ROOT, "data", "binance-btcusdt-trades.parquet")
-        return ParquetTickDataLoader.load(path)
+        return _load_cached(ParquetTickDataLoader.load, path).copy()
 
     @staticmethod
     def parquet_btcusdt_quotes() -> DataFrame:
         path = os.path.join(PACKAGE_ROOT, "data", "binance-btcusdt-quotes.parquet")
-        return ParquetTickDataLoader.load(path)
+        return _load_cached(ParquetTickDataLoader.load, path).copy()
 
     @staticmethod
     def binance_btcusdt_instrument():
@@ -79,6 +79,59 @@ class TestPersistenceCore:
         assert b"".join(blocks) == data
         assert len(data) == 17338
 
+    def test_raw_file_coalesced_block_read(self):
+        # Arrange
+        with open(f"{TEST_DATA}/truefx-audusd-ticks.csv", "rb") as f:
+            data = f.read()
+        self.fs.pipe("/root/raw.csv", data)
+
+        def cat_ranges(paths, starts, ends):
+            return [self.fs.cat_file(p, start=s, end=e) for p, s, e in zip(paths, starts, ends)]
+
+        raw_file = RawFile(fsspec.open("memory:///root/raw.csv"), block_size=100_000)
+
+        # Act
+        # `cat_ranges` isn't in the fsspec lock file (2021.07.0); stand in for newer releases
+        with patch.object(self.fs, "cat_ranges", create=True, side_effect=cat_ranges) as mock:
+            blocks = list(raw_file.iter())
+
+        # Assert
+        assert mock.call_count == 1
+        assert len(blocks) == 49
+        assert b"".join(blocks) == data
+
+    def test_raw_file_coalesced_block_read_raises_range_errors(self):
+        # Arrange
+        self.fs.pipe("/root/raw.csv", b"x" * 250)
+
+        def cat_ranges(paths, starts, ends):
+            # Newer fsspec defaults to `on_error="return"`
+            return [b"x" * 100, FileNotFoundError("/root/raw.csv"), b"x" * 50]
+
+        raw_file = RawFile(fsspec.open("memory:///root/raw.csv"), block_size=100)
+
+        # Act, Assert
+        with patch.object(self.fs, "cat_ranges", create=True, side_effect=cat_ranges):
+            with pytest.raises(FileNotFoundError):
+                list(raw_file.iter())
+
+    @patch("nautilus_trader.persistence.external.core.tqdm", spec=True)
+    def test_raw_file_progress_batches_updates(self, mock_progress):
+        # Arrange
+        raw_file = RawFile(
+            open_file=fsspec.open(f"{TEST_DATA}/1.166564490.bz2"),
+            progress=True,
+            block_size=1000,
+        )
+
+        # Act
+        data = b"".join(raw_file.iter())
+
+        # Assert
+        assert len(data) == 17338
+        result = [call.kwargs for call in mock_progress.mock_calls[:3]]
+        assert result == [{"total": 17338}, {"n": 17338}]
+
     def test_raw_file_process(self):
         # Arrange
         rf = RawFile(
@@ -92,10 +145,23 @@ class TestPersistenceCore:
         # Assert
         assert len(self.catalog.instruments()) == 2
 
+    def test_raw_file_process_raises_parse_errors(self):
+        # Arrange
+        class FailingReader(MockReader):
+            def parse(self, block):
+                raise ValueError("bad block")
+                yield
+
+        rf = RawFile(open_file=fsspec.open(f"{TEST_DATA}/1.166564490.bz2"), block_size=1000)
+
+        # Act, Assert
+        with pytest.raises(ValueError, match="bad block"):
+            process_raw_file(catalog=self.catalog, reader=FailingReader(), raw_file=rf)
+
     def test_raw_file_pickleable(self):
         # Arrange
         path = TEST_DATA_DIR + "/betfair/1.166811431.bz2"  # total size = 151707
-        expected = RawFile(open_file=fsspec.open(path, compression="infer"))
+        expected = RawFile(open_file=fsspec.open(path, compression="infer"), io_buffer_size=65536)
 
         # Act
         data = pickle.dumps(expected)
@@ -105,8 +171,36 @@ class TestPersistenceCore:
         assert result.open_file.fs == expected.open_file.fs
         assert result.open_file.path == expected.open_file.path
         assert result.block_size == expected.block_size
+        assert result.io_buffer_size == 65536
         assert result.open_file.compression == "bz2"
 
+    def test_raw_file_with_progress_pickleable(self):
+        # Arrange
+        path = TEST_DATA_DIR + "/betfair/1.166811431.bz2"
+        expected = RawFile(open_file=fsspec.open(path), block_size=5000, progress=True)
+
+        # Act
+        result: RawFile = pickle.loads(pickle.dumps(expected))  # noqa: S301
+
+        # Assert
+        assert result.progress
+        assert b"".join(result.iter()) == b"".join(expected.iter())
+
+    @patch("nautilus_trader.persistence.external.core.tqdm", spec=True)
+    def test_raw_file_progress_created_on_read(self, mock_progress):
+        # Arrange
+        path = TEST_DATA_DIR + "/betfair/1.166811431.bz2"
+        raw_file = RawFile(open_file=fsspec.open(path), block_size=5000, progress=True)
+
+        # Act
+        result: RawFile = pickle.loads(pickle.dumps(raw_file))  # noqa: S301
+        created = mock_progress.call_count
+        list(result.iter())
+
+        # Assert
+        assert created == 0
+        assert mock_progress.call_count == 1
+
     def test_raw_file_distributed_serializable(self):
         from distributed.protocol import deserialize
         from distributed.protocol import serialize
@@ -132,6 +226,7 @@ class TestPersistenceCore:
             open_file=fsspec.open(f"{TEST_DATA}/1.166564490.bz2"),
             progress=True,
             block_size=5000,
+            progress_flush_bytes=5000,
         )
 
         # Act
@@ -171,6 +266,28 @@ class TestPersistenceCore:
         files = scan_files(glob_path=f"{TEST_DATA_DIR}/*jpy*.csv")
         assert len(files) == 3
 
+    def test_scan_multiple_globs(self):
+        files = scan_files(
+            glob_path=[
+                f"{TEST_DATA_DIR}/*jpy*.csv",
+                f"{TEST_DATA_DIR}/*.csv",
+                f"{TEST_DATA_DIR}/**.txt",
+            ]
+        )
+        assert len(files) == 14
+
+    def test_scan_no_globs(self):
+        assert scan_files(glob_path=[]) == []
+
+    def test_scan_literal_path(self):
+        files = scan_files(glob_path=f"{TEST_DATA_DIR}/missing.csv")
+        assert [of.path for of in files] == [f"{TEST_DATA_DIR}/missing.csv"]
+
+    def test_scan_files_infers_compression(self):
+        files = scan_files(glob_path=f"{TEST_DATA_DIR}/betfair/*.bz2")
+        assert files
+        assert all(of.compression == "bz2" for of in files)
+
     @patch("nautilus_trader.persistence.external.core.load_processed_raw_files")
     def test_scan_processed(self, mock_load_processed_raw_files):
         mock_load_processed_raw_files.return_value = [
@@ -236,12 +353,15 @@ class TestPersistenceCore:
             df=df,
             schema=pa.schema({"value": pa.float64(), "instrument_id": pa.string()}),
             partition_cols=["instrument_id"],
+            row_group_size=2,
         )
         dataset = ds.dataset(str(root.joinpath("sample.parquet")), filesystem=fs)
         result = dataset.to_table().to_pandas()
         assert result.equals(df[["value"]])  # instrument_id is a partition now
         assert dataset.files[0].startswith("/root/sample.parquet/instrument_id=a/")
         assert dataset.files[1].startswith("/root/sample.parquet/instrument_id=b/")
+        with fs.open(dataset.files[0]) as f:
+            assert pq.ParquetFile(f).metadata.num_row_groups == 2
 
     def test_write_parquet_determine_partitions_writes_instrument_id(
         self,
@@ -267,6 +387,29 @@ class TestPersistenceCore:
         expected = "/root/data/quote_tick.parquet/instrument_id=AUD-USD.SIM"
         assert expected in files
 
+    def test_write_tables_rewrites_partition_as_single_file(self):
+        # Arrange
+        for ts in range(3):
+            quote = QuoteTick(
+                instrument_id=TestStubs.audusd_id(),
+                bid=Price.from_str("0.80"),
+                ask=Price.from_str("0.81"),
+                bid_size=Quantity.from_int(1000),
+                ask_size=Quantity.from_int(1000),
+                ts_event=ts,
+                ts_init=ts,
+            )
+
+            tables = dicts_to_dataframes(split_and_serialize([quote]))
+
+            # Act
+            write_tables(catalog=self.catalog, tables=tables)
+
+        # Assert
+        files = self.fs.ls("/root/data/quote_tick.parquet/instrument_id=AUD-USD.SIM")
+        assert len(files) == 1
+        assert len(self.catalog.quote_ticks()) == 3
+
     def test_read_and_clear_existing_data_single_partition(
         self,
     ):
@@ -320,7 +463,8 @@ class TestPersistenceCore:
                 catalog=self.catalog, path=path, instrument_id="a", partition_cols=["value"]
             )
 
-    def test_load_text_betfair(self):
+    @pytest.mark.parametrize("scheduler", ["sync", "threads"])
+    def test_load_text_betfair(self, scheduler):
         instrument_provider = BetfairInstrumentProvider.from_instruments([])
 
         files = process_files(
@@ -328,6 +472,7 @@ class TestPersistenceCore:
             reader=BetfairTestStubs.betfair_reader(instrument_provider=instrument_provider),
             catalog=self.catalog,
             instrument_provider=instrument_provider,
+            scheduler=scheduler,
         )
         expected = {
             TEST_DATA_DIR + "/1.166564490.bz2": 2908,
@@ -336,6 +481,23 @@ class TestPersistenceCore:
         }
         assert files == expected
 
+    @pytest.mark.parametrize("scheduler", ["sync", "threads"])
+    def test_load_text_betfair_reader_factory(self, scheduler):
+        def reader_factory():
+            instrument_provider = BetfairInstrumentProvider.from_instruments([])
+            return BetfairTestStubs.betfair_reader(instrument_provider=instrument_provider)
+
+        files = process_files(
+            glob_path=f"{TEST_DATA_DIR}/1.166564490*",
+            reader=None,
+            reader_factory=reader_factory,
+            catalog=self.catalog,
+            scheduler=scheduler,
+        )
+
+        assert files == {TEST_DATA + "/1.166564490.bz2": 2908}
+        assert len(self.catalog.instruments()) == 2
+
     def test_data_catalog_instruments_no_partition(self):
         self._loaded_data_into_catalog()
         path = f"{self.catalog.path}/data/betting_instrument.parquet"
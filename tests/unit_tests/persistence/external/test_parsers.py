@@ -175,6 +175,18 @@ class TestPersistenceParsers:
         result = process_raw_file(catalog=self.mock_catalog, raw_file=raw_file, reader=reader)
         assert result == 100000
 
+    def test_csv_reader_dataframe_columns(self):
+        columns = []
+
+        def parser(data):
+            columns.append(list(data.columns))
+            yield from ()
+
+        reader = CSVReader(block_parser=parser, as_dataframe=True, columns=["timestamp", "bid"])
+        raw_file = make_raw_files(glob_path=f"{TEST_DATA_DIR}/truefx-audusd-ticks.csv")[0]
+        process_raw_file(catalog=self.mock_catalog, raw_file=raw_file, reader=reader)
+        assert columns == [["timestamp", "bid"]]
+
     def test_text_reader(self):
         provider = BetfairInstrumentProvider.from_instruments([])
         reader = BetfairTestStubs.betfair_reader(provider)  # type: TextReader
@@ -1,6 +1,7 @@
 import logging
 import os
 import time
+from unittest.mock import patch
 
 import dask
 import pytest
@@ -8,12 +9,16 @@ from dask import compute
 from dask import delayed
 from distributed import Client
 
+from nautilus_trader.persistence.external.synchronization import in_process_cluster
+from nautilus_trader.persistence.external.synchronization import local_lock
 from nautilus_trader.persistence.external.synchronization import named_lock
 from tests.test_kit import PACKAGE_ROOT
 
 
 logger = logging.getLogger()
 
+MODULE = "nautilus_trader.persistence.external.synchronization"
+
 TEST_DATA = PACKAGE_ROOT + "/data"
 
 
@@ -25,8 +30,7 @@ def _run():
             time.sleep(0.1)
 
 
-@pytest.mark.parametrize("scheduler", ("sync", Client()))
-def test_named_lock_sync(scheduler):
+def _compute_with_named_lock(scheduler):
     if os.path.exists("test.file"):
         os.unlink("test.file")
     tasks = (_run(), _run(), _run())
@@ -35,3 +39,32 @@ def test_named_lock_sync(scheduler):
     r = open("test.file", "rb").read()
     assert r == b"hellohellohello"
     os.unlink("test.file")
+
+
+@pytest.mark.parametrize("scheduler", ("sync", "threads"))
+def test_named_lock_sync(scheduler):
+    _compute_with_named_lock(scheduler=scheduler)
+
+
+def test_named_lock_distributed():
+    with Client() as client:
+        assert not in_process_cluster()
+        _compute_with_named_lock(scheduler=client)
+
+
+def test_named_lock_without_client_uses_local_lock():
+    # Act
+    with patch("distributed.get_client", side_effect=ValueError("No clients found")):
+        with patch(f"{MODULE}.local_lock", wraps=local_lock) as mock_local:
+            with patch(f"{MODULE}.distributed_lock") as mock_distributed:
+                _compute_with_named_lock(scheduler="threads")
+
+    # Assert
+    assert mock_local.call_count == 3
+    assert mock_distributed.call_count == 0
+
+
+def test_named_lock_in_process_cluster():
+    with Client(processes=False) as client:
+        assert in_process_cluster()
+        _compute_with_named_lock(scheduler=client)
@@ -1,5 +1,6 @@
 import datetime
 import sys
+from unittest.mock import patch
 
 import fsspec
 import pyarrow.dataset as ds
@@ -14,11 +15,14 @@ from nautilus_trader.persistence.catalog import DataCatalog
 from nautilus_trader.persistence.external.core import dicts_to_dataframes
 from nautilus_trader.persistence.external.core import process_files
 from nautilus_trader.persistence.external.core import split_and_serialize
+from nautilus_trader.persistence.external.core import write_parquet
 from nautilus_trader.persistence.external.core import write_tables
+from nautilus_trader.serialization.arrow.serializer import get_schema
 from tests.integration_tests.adapters.betfair.test_kit import BetfairTestStubs
 from tests.test_kit import PACKAGE_ROOT
 from tests.test_kit.mocks import data_catalog_setup
 from tests.test_kit.providers import TestInstrumentProvider
+from tests.test_kit.stubs import TestStubs
 
 
 TEST_DATA_DIR = PACKAGE_ROOT + "/data"
@@ -57,6 +61,100 @@ class TestPersistenceCatalog:
         instruments = self.catalog.instruments(as_nautilus=True)
         assert all(isinstance(ins, BettingInstrument) for ins in instruments)
 
+    def test_data_catalog_query_pre_buffers_reads(self):
+        # Act
+        with patch("nautilus_trader.persistence.catalog.ds.dataset", wraps=ds.dataset) as mock:
+            instruments = self.catalog.instruments()
+
+        # Assert
+        assert len(instruments) == 2
+        file_format = mock.call_args.kwargs["format"]
+        assert file_format.default_fragment_scan_options.pre_buffer
+
+    def test_data_catalog_caches_dataset_until_written(self):
+        # Arrange
+        instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+        tick = QuoteTick(
+            instrument_id=instrument.id,
+            bid=Price(10, 1),
+            ask=Price(11, 1),
+            bid_size=Quantity(10, 1),
+            ask_size=Quantity(10, 1),
+            ts_init=0,
+            ts_event=0,
+        )
+        before = len(self.catalog.quote_ticks())
+
+        # Act
+        with patch("nautilus_trader.persistence.catalog.ds.dataset", wraps=ds.dataset) as mock:
+            self.catalog.quote_ticks()
+            self.catalog.quote_ticks()
+            cached_calls = mock.call_count
+            tables = dicts_to_dataframes(split_and_serialize([tick]))
+            write_tables(catalog=self.catalog, tables=tables)
+            after = len(self.catalog.quote_ticks())
+
+        # Assert
+        assert cached_calls == 0
+        assert mock.call_count == 1
+        assert after == before + 1
+
+    def test_data_catalog_sees_partitions_written_elsewhere(self):
+        # Arrange
+        def quote_tables(instrument_id):
+            tick = QuoteTick(
+                instrument_id=instrument_id,
+                bid=Price(10, 1),
+                ask=Price(11, 1),
+                bid_size=Quantity(10, 1),
+                ask_size=Quantity(10, 1),
+                ts_init=0,
+                ts_event=0,
+            )
+            return dicts_to_dataframes(split_and_serialize([tick]))
+
+        write_tables(catalog=self.catalog, tables=quote_tables(TestStubs.audusd_id()))
+        assert len(self.catalog.quote_ticks()) == 1
+
+        # Act - a write that doesn't go through this catalog (i.e. another process)
+        (df,) = quote_tables(TestStubs.usdjpy_id())[QuoteTick].values()
+        write_parquet(
+            fs=self.catalog.fs,
+            path=str(self.catalog.path / "data" / "quote_tick.parquet"),
+            df=df,
+            partition_cols=["instrument_id"],
+            schema=get_schema(QuoteTick),
+        )
+
+        # Assert
+        assert len(self.catalog.quote_ticks()) == 2
+
+    def test_data_catalog_discovers_dataset_once(self):
+        # Arrange
+        self.catalog.trade_ticks()
+
+        # Act
+        with patch.object(self.catalog.fs, "find", wraps=self.catalog.fs.find) as mock:
+            self.catalog.trade_ticks()
+            self.catalog.trade_ticks()
+
+        # Assert
+        assert mock.call_count == 0
+
+    def test_data_catalog_query_refreshes_stale_dataset(self):
+        # Arrange
+        expected = len(self.catalog.trade_ticks())
+        path = str(self.catalog.path / "data" / "trade_tick.parquet")
+        # Rewrite the files behind the catalog's back (i.e. from another process)
+        for fn in self.catalog.dataset(path).files:
+            self.catalog.fs.mv(fn, fn[: -len(".parquet")] + "-rewritten.parquet")
+
+        # Act
+        result = self.catalog.trade_ticks()
+
+        # Assert
+        assert len(result) == expected
+
     def test_partition_key_correctly_remapped(self):
         # Arrange
         instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD")